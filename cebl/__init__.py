@@ -3,6 +3,7 @@ CEBL SDK Package
 
 This package provides tools for interacting with the CEBL API, including:
 - `CEBLClient`: For retrieving data from the CEBL API.
+- `AsyncCEBLClient`: For retrieving data concurrently (requires the `async` extra).
 - `CEBLGameDataProvider`: For fetching and processing detailed game data.
 - `draw_court`: For drawing a basketball court on a Matplotlib figure.
 
@@ -10,8 +11,32 @@ Usage:
 - Import classes and functions from this package to work with CEBL data and visualizations.
 """
 
-from .client import CEBLClient
-from .court import draw_court
-from .gamestats import CEBLGameDataProvider
+__all__ = ["AsyncCEBLClient", "CEBLClient", "CEBLGameDataProvider", "configure_logging", "draw_court"]
 
-__all__ = ["CEBLClient", "CEBLGameDataProvider", "draw_court"]
+
+def __getattr__(name: str):
+    # Lazy imports (PEP 562) keep `import cebl` fast: draw_court pulls in
+    # matplotlib (~200 ms), the clients pull in pandas, and AsyncCEBLClient
+    # touches the optional httpx dependency, so each loads only when first
+    # referenced.
+    if name == "CEBLClient":
+        from .client import CEBLClient
+
+        return CEBLClient
+    if name == "AsyncCEBLClient":
+        from .async_client import AsyncCEBLClient
+
+        return AsyncCEBLClient
+    if name == "CEBLGameDataProvider":
+        from .gamestats import CEBLGameDataProvider
+
+        return CEBLGameDataProvider
+    if name == "configure_logging":
+        from .utils import configure_logging
+
+        return configure_logging
+    if name == "draw_court":
+        from .court import draw_court
+
+        return draw_court
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
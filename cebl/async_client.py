@@ -0,0 +1,372 @@
+import asyncio
+import logging
+from typing import Iterable, Optional
+
+import pandas as pd
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    httpx = None
+
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx when available
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+from .constants import (
+    AggregatedStatisticsCompetitionType,
+    ModeType,
+    PlayerSegmentType,
+    PlayerStatisticsCompetitionType,
+    TeamSegmentType,
+    YearType,
+)
+from .utils import prepare_request
+
+
+class AsyncCEBLClient:
+    """
+    An asynchronous client for interacting with the CEBL API.
+
+    Mirrors `CEBLClient` with coroutine variants of every `get_*` method so that
+    callers can issue many requests concurrently over a single reused connection
+    pool. Fetching games across several seasons or rosters for many teams is
+    network-bound, so overlapping the round-trips collapses total latency to
+    roughly the slowest single request.
+
+    Attributes:
+        headers (dict): HTTP headers used for API requests, including the API key for authentication.
+
+    Methods:
+        aget_games(year, team_name=None) -> pd.DataFrame:
+            Fetch games for a given year, optionally filtered by team name.
+
+        aget_teams(year) -> pd.DataFrame:
+            Fetch all teams for a given year.
+
+        aget_player_statistics(player_id, mode, career_only=False, competition=None) -> pd.DataFrame:
+            Fetch statistics for a specific player.
+
+        aget_player_statistics_aggregated(season, mode='TOTALS', competition=None, segment=None, team_short_name=None) -> pd.DataFrame:
+            Fetch aggregated player statistics for a season.
+
+        aget_team_roster(team_short_name, year) -> pd.DataFrame:
+            Fetch the roster for a specific team in a given year.
+
+        aget_team_statistics_aggregated(season, mode, competition=None, segment=None) -> pd.DataFrame:
+            Fetch aggregated team statistics for a season.
+
+        get_many_games(years) -> pd.DataFrame:
+            Fetch games for several years concurrently and return one combined DataFrame.
+
+    Example:
+    ```
+        async with AsyncCEBLClient(CEBL_API_KEY="your-api-key") as client:
+            games = await client.get_many_games(["2022", "2023", "2024"])
+            print(games.head())
+    ```
+
+    Notes:
+        - Requires the optional `httpx` dependency (`pip install cebl[async]`).
+        - Errors during API requests are logged using the `logging` module.
+    """
+
+    def __init__(self, CEBL_API_KEY: str):
+        """
+        Initialize the asynchronous CEBL API client.
+
+        Args:
+            CEBL_API_KEY (str): API key for authentication.
+
+        Raises:
+            ImportError: If the optional `httpx` dependency is not installed.
+        """
+        if not CEBL_API_KEY:
+            raise ValueError("API key must be provided")
+
+        if httpx is None:
+            raise ImportError("httpx is required for AsyncCEBLClient. Install it with: pip install cebl[async]")
+
+        self.headers = {
+            "X-Api-Key": CEBL_API_KEY,
+            "Accept": "application/json, text/plain, */*",
+            "Origin": "https://cebl-stats-hub.web.app",
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+                " AppleWebKit/537.36 (KHTML, like Gecko)"
+                " Chrome/91.0.4472.124 Safari/537.36"
+            ),
+        }
+        self._teams_cache: dict[YearType, dict[str, int]] = {}
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=32),
+            timeout=20,
+        )
+
+    async def __aenter__(self) -> "AsyncCEBLClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def _aget(self, endpoint_name: str, params: Optional[dict] = None, **path_kwargs: str) -> Optional[dict]:
+        """
+        Make an asynchronous HTTP GET request and return the JSON response.
+
+        Args:
+            endpoint_name (str): The name of the endpoint to use.
+            params (dict, optional): Query parameters to include in the request.
+            path_kwargs: Parameters used to format the endpoint path.
+
+        Returns:
+            Optional[dict]: The JSON response if successful, otherwise None.
+        """
+        url, params = prepare_request(endpoint_name, params, **path_kwargs)
+
+        try:
+            response = await self._client.get(url, params=params)
+
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 401:
+                logging.error("Unauthorized access. The API key may be invalid or expired.")
+                raise PermissionError("Unauthorized access. The API key may be invalid or expired.")
+            else:
+                logging.error(
+                    "Request to %s failed with status code %d. Response: %s", url, response.status_code, response.text
+                )
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            logging.error("Request failed: %s", e)
+            raise
+
+    async def _teams_index(self, year: YearType) -> dict[str, int]:
+        """
+        Build and cache a lowercased team name/short name to ID mapping for a year.
+
+        The teams table for a season is fetched at most once per client; every
+        subsequent lookup is an O(1) dictionary access with no HTTP traffic.
+        The raw records are indexed directly — no DataFrame is built for this
+        internal path; the public aget_teams API still returns one.
+
+        Args:
+            year (YearType): The year to build the index for.
+
+        Returns:
+            dict[str, int]: Mapping of lowercased team names and short names to team IDs.
+        """
+        index = self._teams_cache.get(year)
+        if index is None:
+            teams = await self._aget("teams", year=year) or []
+            index = {}
+            for team in teams:
+                index[team["name_en"].lower()] = team["id"]
+                index[team["short_name_en"].lower()] = team["id"]
+            self._teams_cache[year] = index
+        return index
+
+    async def __get_team_id(self, team_name: str, year: YearType) -> int:
+        """
+        Retrieve the ID of a team based on its name or short name and year.
+
+        Args:
+            team_name (str): The name or short name of the team.
+            year (YearType): The year to fetch the team ID for.
+
+        Returns:
+            int: The ID of the team.
+
+        Raises:
+            ValueError: If the team is not found for the specified year.
+        """
+        try:
+            return (await self._teams_index(year))[team_name.lower()]
+        except KeyError:
+            raise ValueError(f"Team {team_name} not found for year {year}") from None
+
+    async def aget_games(self, year: YearType, team_name: Optional[str] = None) -> pd.DataFrame:
+        """
+        Retrieve games for a specific year, optionally filtered by team name.
+
+        Args:
+            year (YearType): The year to fetch games for.
+            team_name (str, optional): The name of the team to filter by.
+
+        Returns:
+            pd.DataFrame: DataFrame of games for the specified year and optional team.
+        """
+        params: dict = {}
+        if team_name:
+            try:
+                team_id = await self.__get_team_id(team_name, year)
+                params["team_id"] = team_id
+            except ValueError as e:
+                logging.error("Error retrieving team ID for %s: %s", team_name, e)
+
+        data = await self._aget("games", params, year=year)
+        df = pd.DataFrame(data) if data else pd.DataFrame()
+        if df.empty:
+            logging.error("No games data returned for year %s.", year)
+        return df
+
+    async def aget_teams(self, year: YearType) -> pd.DataFrame:
+        """
+        Retrieve teams for a specific year.
+
+        Args:
+            year (YearType): The year to fetch teams for.
+
+        Returns:
+            pd.DataFrame: DataFrame of teams for the specified year.
+        """
+        data = await self._aget("teams", year=year)
+        df = pd.DataFrame(data) if data else pd.DataFrame()
+        if df.empty:
+            logging.error("No teams data returned for year %s.", year)
+        return df
+
+    async def aget_player_statistics(
+        self,
+        player_id: int,
+        mode: ModeType,
+        career_only: bool = False,
+        competition: Optional[PlayerStatisticsCompetitionType] = None,
+    ) -> pd.DataFrame:
+        """
+        Retrieve player statistics.
+
+        Args:
+            player_id (int): The ID of the player.
+            mode (ModeType): The mode of statistics ('PER_GAME' or 'TOTALS').
+            career_only (bool, optional): Whether to fetch career-only statistics. Defaults to False.
+            competition (PlayerStatisticsCompetitionType, optional): Optional competition type.
+
+        Returns:
+            pd.DataFrame: DataFrame of player statistics.
+        """
+        params = {"mode": mode, "career_only": str(career_only).lower()}
+        if competition:
+            params["competition"] = competition
+
+        data = await self._aget("player_statistics", params, player_id=str(player_id))
+        df = pd.DataFrame(data) if data else pd.DataFrame()
+        if df.empty:
+            logging.error(
+                "No player statistics data returned for player ID %s for competition: %s.", player_id, competition
+            )
+        return df
+
+    async def aget_player_statistics_aggregated(
+        self,
+        season: YearType,
+        mode: ModeType = "TOTALS",
+        competition: Optional[AggregatedStatisticsCompetitionType] = None,
+        segment: Optional[PlayerSegmentType] = None,
+        team_short_name: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Retrieve aggregated player statistics.
+
+        Args:
+            season (YearType): The season year.
+            mode (ModeType, optional): The mode of statistics ('PER_GAME' or 'TOTALS'). Defaults to 'TOTALS'.
+            competition (AggregatedStatisticsCompetitionType, optional): Optional competition type.
+            segment (PlayerSegmentType, optional): Optional segment type.
+            team_short_name (str, optional): Optional team short name.
+
+        Returns:
+            pd.DataFrame: DataFrame of aggregated player statistics.
+        """
+        params = {"season": season, "mode": mode}
+        if competition:
+            params["competition"] = competition
+        if segment:
+            params["segment"] = segment
+        if team_short_name:
+            team_id = await self.__get_team_id(team_short_name, season)
+            params["team_id"] = str(team_id)
+
+        data = await self._aget("players_statistics_aggregated", params)
+        df = pd.DataFrame(data) if data else pd.DataFrame()
+        if df.empty:
+            logging.error("No aggregated player statistics data returned for season %s.", season)
+        return df
+
+    async def aget_team_roster(self, team_short_name: str, year: YearType) -> pd.DataFrame:
+        """
+        Retrieve the roster of a team for a specific year.
+
+        Args:
+            team_short_name (str): The short name of the team.
+            year (YearType): The year to fetch the roster for.
+
+        Returns:
+            pd.DataFrame: DataFrame of the team roster.
+        """
+        team_id = await self.__get_team_id(team_short_name, year)
+
+        data = await self._aget("team_roster", team_id=str(team_id), year=year)
+        df = pd.DataFrame(data) if data else pd.DataFrame()
+        if df.empty:
+            logging.error("No team roster data returned for team %s and year %s.", team_short_name, year)
+        return df
+
+    async def aget_team_statistics_aggregated(
+        self,
+        season: YearType,
+        mode: ModeType,
+        competition: Optional[AggregatedStatisticsCompetitionType] = None,
+        segment: Optional[TeamSegmentType] = None,
+    ) -> pd.DataFrame:
+        """
+        Retrieve aggregated team statistics.
+
+        Args:
+            season (YearType): The season year.
+            mode (ModeType): The mode of statistics ('PER_GAME' or 'TOTALS').
+            competition (AggregatedStatisticsCompetitionType, optional): Optional competition type.
+            segment (TeamSegmentType, optional): Optional segment type.
+
+        Returns:
+            pd.DataFrame: DataFrame of aggregated team statistics.
+        """
+        params = {"season": season, "mode": mode}
+        if competition:
+            params["competition"] = competition
+        if segment:
+            params["segment"] = segment
+
+        data = await self._aget("teams_statistics_aggregated", params)
+        df = pd.DataFrame(data) if data else pd.DataFrame()
+        if df.empty:
+            logging.error("No aggregated team statistics data returned for season %s.", season)
+        return df
+
+    async def get_many_games(self, years: Iterable[YearType]) -> pd.DataFrame:
+        """
+        Retrieve games for several years concurrently.
+
+        Args:
+            years (Iterable[YearType]): The years to fetch games for.
+
+        Returns:
+            pd.DataFrame: One DataFrame of games across all requested years.
+        """
+        frames = await asyncio.gather(*[self.aget_games(year) for year in years])
+        frames = [df for df in frames if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        # sort=False keeps column order as fetched instead of paying an
+        # alphabetical sort across the combined columns.
+        return pd.concat(frames, ignore_index=True, sort=False)
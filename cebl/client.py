@@ -1,7 +1,13 @@
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Literal, Optional
 
 import pandas as pd
+from requests import Session
+from requests.adapters import HTTPAdapter, Retry
 
 from .constants import (
     AggregatedStatisticsCompetitionType,
@@ -11,7 +17,122 @@ from .constants import (
     TeamSegmentType,
     YearType,
 )
-from .utils import build_url, make_request
+from .utils import build_url, iter_records, make_request
+
+# Known column dtypes per endpoint. Casting explicitly locks the schema after a
+# single from_records pass instead of leaving ids and scores to dtype
+# re-inference; nullable Int64 keeps columns intact when the API returns nulls
+# (e.g. scores of unplayed games).
+_SCHEMAS: dict[str, dict[str, str]] = {
+    "games": {
+        "id": "Int64",
+        "home_team_id": "Int64",
+        "away_team_id": "Int64",
+        "home_team_score": "Int64",
+        "away_team_score": "Int64",
+    },
+    "teams": {"id": "Int64"},
+    "player_statistics": {"id": "Int64", "season": "Int64", "team_id": "Int64", "played": "Int64"},
+    "players_statistics_aggregated": {"id": "Int64", "season": "Int64", "team_id": "Int64", "played": "Int64"},
+    "team_roster": {"id": "Int64"},
+    "teams_statistics_aggregated": {"id": "Int64", "season": "Int64"},
+}
+
+
+def _as_params(params) -> dict[str, str]:
+    """
+    Convert a parameter dataclass into a query dict, dropping unset values.
+
+    Args:
+        params: A parameter dataclass instance.
+
+    Returns:
+        dict[str, str]: Query parameters with None-valued fields removed.
+    """
+    return asdict(params, dict_factory=lambda items: {key: value for key, value in items if value is not None})
+
+
+@dataclass(slots=True)
+class _PlayerStatisticsParams:
+    mode: ModeType
+    career_only: str
+    competition: Optional[PlayerStatisticsCompetitionType] = None
+
+
+@dataclass(slots=True)
+class _PlayerAggregatedParams:
+    season: YearType
+    mode: ModeType = "TOTALS"
+    competition: Optional[AggregatedStatisticsCompetitionType] = None
+    segment: Optional[PlayerSegmentType] = None
+    team_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class _TeamAggregatedParams:
+    season: YearType
+    mode: ModeType
+    competition: Optional[AggregatedStatisticsCompetitionType] = None
+    segment: Optional[TeamSegmentType] = None
+
+
+@lru_cache(maxsize=64)
+def _stats_params(
+    mode: ModeType,
+    career_only: bool,
+    competition: Optional[PlayerStatisticsCompetitionType],
+) -> dict[str, str]:
+    """
+    Build and cache the query dict for the player-statistics endpoint.
+
+    The argument space is a handful of interned literals, so each distinct
+    combination is built exactly once per process. Callers must copy the
+    returned dict before mutating it.
+
+    Args:
+        mode (ModeType): The mode of statistics ('PER_GAME' or 'TOTALS').
+        career_only (bool): Whether to fetch career-only statistics.
+        competition (PlayerStatisticsCompetitionType, optional): Optional competition type.
+
+    Returns:
+        dict[str, str]: Query parameters for the endpoint.
+    """
+    return _as_params(
+        _PlayerStatisticsParams(
+            mode=mode,
+            career_only="true" if career_only else "false",
+            competition=competition,
+        )
+    )
+
+
+DtypeBackendType = Literal["numpy_nullable", "pyarrow"]
+
+
+def _to_df(data: Optional[list[dict]], endpoint: str, dtype_backend: Optional[DtypeBackendType] = None) -> pd.DataFrame:
+    """
+    Build a DataFrame from endpoint records with the endpoint's known dtypes.
+
+    Args:
+        data (list[dict], optional): Records returned by the API, or None.
+        endpoint (str): The endpoint name used to select the dtype schema.
+        dtype_backend (DtypeBackendType, optional): Backend to convert the
+            resulting columns to, e.g. 'pyarrow' for Arrow-backed storage.
+
+    Returns:
+        pd.DataFrame: DataFrame with known columns cast to their dtypes, or an
+        empty DataFrame when no data was returned.
+    """
+    if not data:
+        return pd.DataFrame()
+
+    df = pd.DataFrame.from_records(data)
+    casts = {column: dtype for column, dtype in _SCHEMAS.get(endpoint, {}).items() if column in df.columns}
+    if casts:
+        df = df.astype(casts)
+    if dtype_backend is not None:
+        df = df.convert_dtypes(dtype_backend=dtype_backend)
+    return df
 
 
 class CEBLClient:
@@ -54,16 +175,36 @@ class CEBLClient:
         - Dependencies: Requires `pandas` and `requests` libraries.
     """
 
-    def __init__(self, CEBL_API_KEY: str):
+    def __init__(
+        self,
+        CEBL_API_KEY: str,
+        cache: bool = False,
+        dtype_backend: Optional[DtypeBackendType] = None,
+    ):
         """
         Initialize the CEBL API client.
 
         Args:
             CEBL_API_KEY (str): API key for authentication.
+            cache (bool, optional): Whether to cache responses on disk in a
+                sqlite database (`.cebl_cache.sqlite` in the current working
+                directory). Past seasons never expire, other responses expire
+                after 24 hours. Requires the optional `requests-cache`
+                dependency (`pip install cebl[cache]`). Defaults to False.
+            dtype_backend (DtypeBackendType, optional): DataFrame dtype backend
+                for returned data. 'pyarrow' stores string columns in contiguous
+                Arrow buffers (roughly half the memory of object arrays) and
+                requires the optional `pyarrow` dependency
+                (`pip install cebl[arrow]`). Defaults to None (numpy-backed).
+
+        Raises:
+            ImportError: If `cache` is requested but `requests-cache` is not installed.
         """
         if not CEBL_API_KEY:
             raise ValueError("API key must be provided")
 
+        self._dtype_backend = dtype_backend
+
         self.headers = {
             "X-Api-Key": CEBL_API_KEY,
             "Accept": "application/json, text/plain, */*",
@@ -74,6 +215,93 @@ class CEBLClient:
                 " Chrome/91.0.4472.124 Safari/537.36"
             ),
         }
+        self._teams_cache: dict[YearType, dict[str, int]] = {}
+
+        self._session = self._build_cached_session() if cache else Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self._session.mount("https://", adapter)
+
+    @staticmethod
+    def _build_cached_session() -> Session:
+        """
+        Build a sqlite-backed caching session for API responses.
+
+        Completed seasons are immutable, so their games, teams, and roster
+        responses are cached forever; everything else expires after 24 hours.
+        Stale entries are served if the API errors.
+
+        Returns:
+            Session: A requests-cache CachedSession.
+
+        Raises:
+            ImportError: If the optional `requests-cache` dependency is not installed.
+        """
+        try:
+            from requests_cache import CachedSession
+        except ImportError:
+            raise ImportError(
+                "requests-cache is required for response caching. Install it with: pip install cebl[cache]"
+            ) from None
+
+        current_year = datetime.now().year
+        urls_expire_after: dict[str, int] = {}
+        for year in range(2019, current_year):
+            urls_expire_after[f"*/games/{year}"] = -1
+            urls_expire_after[f"*/teams/{year}"] = -1
+            urls_expire_after[f"*/teams/*/roster/{year}"] = -1
+
+        return CachedSession(
+            cache_name=".cebl_cache",
+            backend="sqlite",
+            expire_after=86400,
+            stale_if_error=True,
+            allowable_methods=("GET",),
+            urls_expire_after=urls_expire_after,
+        )
+
+    def __enter__(self) -> "CEBLClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its connection pool."""
+        self._session.close()
+
+    def parallel(self, calls: Iterable[Callable[[], Any]]) -> list:
+        """
+        Run several zero-argument calls concurrently and return their results.
+
+        Requests to the API release the GIL during socket I/O, so running
+        independent fetches in threads collapses total latency to roughly the
+        slowest single call. All threads share this client's connection pool.
+
+        Args:
+            calls (Iterable[Callable]): Zero-argument callables, typically
+                lambdas wrapping this client's get_* methods.
+
+        Returns:
+            list: The results of each call, in the order the calls were given.
+
+        Example:
+        ```
+            games, teams = client.parallel(
+                [lambda: client.get_games("2024"), lambda: client.get_teams("2024")]
+            )
+        ```
+        """
+        calls = list(calls)
+        if not calls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(calls))) as executor:
+            return list(executor.map(lambda call: call(), calls))
 
     def get_games(self, year: YearType, team_name: Optional[str] = None) -> pd.DataFrame:
         """
@@ -92,14 +320,48 @@ class CEBLClient:
                 team_id = self.__get_team_id(team_name, year)
                 params["team_id"] = team_id
             except ValueError as e:
-                logging.error(f"Error retrieving team ID for {team_name}: {e}")
+                logging.error("Error retrieving team ID for %s: %s", team_name, e)
 
         endpoint = "games"
         url = build_url(endpoint, year=year)
-        data = make_request(url, self.headers, endpoint_name=endpoint, params=params)
-        df = pd.DataFrame(data) if data else pd.DataFrame()
+        data = make_request(url, self.headers, endpoint_name=endpoint, params=params, session=self._session)
+        df = _to_df(data, endpoint, self._dtype_backend)
         if df.empty:
-            logging.error(f"No games data returned for year {year}.")
+            logging.error("No games data returned for year %s.", year)
+        return df
+
+    def get_games_multi(self, years: Iterable[YearType]) -> pd.DataFrame:
+        """
+        Retrieve games for several years concurrently.
+
+        The per-year requests run in parallel over the shared connection pool
+        and the raw records are combined into a single DataFrame at the end,
+        avoiding one DataFrame construction per year.
+
+        Args:
+            years (Iterable[YearType]): The years to fetch games for.
+
+        Returns:
+            pd.DataFrame: One DataFrame of games across all requested years.
+        """
+        years = list(years)
+        if not years:
+            return pd.DataFrame()
+
+        endpoint = "games"
+
+        def fetch(year: YearType) -> list[dict]:
+            url = build_url(endpoint, year=year)
+            return make_request(url, self.headers, endpoint_name=endpoint, session=self._session) or []
+
+        records: list[dict] = []
+        with ThreadPoolExecutor(max_workers=min(8, len(years))) as executor:
+            for data in executor.map(fetch, years):
+                records.extend(data)
+
+        df = _to_df(records, endpoint, self._dtype_backend)
+        if df.empty:
+            logging.error("No games data returned for years %s.", years)
         return df
 
     def get_teams(self, year: YearType) -> pd.DataFrame:
@@ -114,12 +376,39 @@ class CEBLClient:
         """
         endpoint = "teams"
         url = build_url(endpoint, year=year)
-        data = make_request(url, self.headers, endpoint_name=endpoint)
-        df = pd.DataFrame(data) if data else pd.DataFrame()
+        data = make_request(url, self.headers, endpoint_name=endpoint, session=self._session)
+        df = _to_df(data, endpoint, self._dtype_backend)
         if df.empty:
-            logging.error(f"No teams data returned for year {year}.")
+            logging.error("No teams data returned for year %s.", year)
         return df
 
+    def _teams_index(self, year: YearType) -> dict[str, int]:
+        """
+        Build and cache a lowercased team name/short name to ID mapping for a year.
+
+        The teams table for a season is fetched at most once per client; every
+        subsequent lookup is an O(1) dictionary access with no HTTP traffic.
+        The raw records are indexed directly — no DataFrame is built for this
+        internal path; the public get_teams API still returns one.
+
+        Args:
+            year (YearType): The year to build the index for.
+
+        Returns:
+            dict[str, int]: Mapping of lowercased team names and short names to team IDs.
+        """
+        index = self._teams_cache.get(year)
+        if index is None:
+            endpoint = "teams"
+            url = build_url(endpoint, year=year)
+            teams = make_request(url, self.headers, endpoint_name=endpoint, session=self._session) or []
+            index = {}
+            for team in teams:
+                index[team["name_en"].lower()] = team["id"]
+                index[team["short_name_en"].lower()] = team["id"]
+            self._teams_cache[year] = index
+        return index
+
     def __get_team_id(self, team_name: str, year: YearType) -> int:
         """
         Retrieve the ID of a team based on its name or short name and year.
@@ -134,12 +423,10 @@ class CEBLClient:
         Raises:
             ValueError: If the team is not found for the specified year.
         """
-        teams = self.get_teams(year)
-        for _, team in teams.iterrows():
-            if team["name_en"].lower() == team_name.lower() or team["short_name_en"].lower() == team_name.lower():
-                return team["id"]
-
-        raise ValueError(f"Team {team_name} not found for year {year}")
+        try:
+            return self._teams_index(year)[team_name.lower()]
+        except KeyError:
+            raise ValueError(f"Team {team_name} not found for year {year}") from None
 
     def get_player_statistics(
         self,
@@ -160,17 +447,15 @@ class CEBLClient:
         Returns:
             pd.DataFrame: DataFrame of player statistics.
         """
-        params = {"mode": mode, "career_only": str(career_only).lower()}
-        if competition:
-            params["competition"] = competition
+        params = dict(_stats_params(mode, career_only, competition))
 
         endpoint = "player_statistics"
         url = build_url(endpoint, player_id=str(player_id))
-        data = make_request(url, self.headers, endpoint_name=endpoint, params=params)
-        df = pd.DataFrame(data) if data else pd.DataFrame()
+        data = make_request(url, self.headers, endpoint_name=endpoint, params=params, session=self._session)
+        df = _to_df(data, endpoint, self._dtype_backend)
         if df.empty:
             logging.error(
-                f"No player statistics data returned for player ID {player_id} for competition: {competition}."
+                "No player statistics data returned for player ID %s for competition: %s.", player_id, competition
             )
         return df
 
@@ -195,21 +480,17 @@ class CEBLClient:
         Returns:
             pd.DataFrame: DataFrame of aggregated player statistics.
         """
-        params = {"season": season, "mode": mode}
-        if competition:
-            params["competition"] = competition
-        if segment:
-            params["segment"] = segment
-        if team_short_name:
-            team_id = self.__get_team_id(team_short_name, season)
-            params["team_id"] = str(team_id)
+        team_id = str(self.__get_team_id(team_short_name, season)) if team_short_name else None
+        params = _as_params(
+            _PlayerAggregatedParams(season=season, mode=mode, competition=competition, segment=segment, team_id=team_id)
+        )
 
         endpoint = "players_statistics_aggregated"
         url = build_url(endpoint)
-        data = make_request(url, self.headers, endpoint_name=endpoint, params=params)
-        df = pd.DataFrame(data) if data else pd.DataFrame()
+        data = list(iter_records(url, self.headers, endpoint_name=endpoint, params=params, session=self._session))
+        df = _to_df(data, endpoint, self._dtype_backend)
         if df.empty:
-            logging.error(f"No aggregated player statistics data returned for season {season}.")
+            logging.error("No aggregated player statistics data returned for season %s.", season)
         return df
 
     def get_team_roster(self, team_short_name: str, year: YearType) -> pd.DataFrame:
@@ -227,10 +508,10 @@ class CEBLClient:
 
         endpoint = "team_roster"
         url = build_url(endpoint, team_id=str(team_id), year=year)
-        data = make_request(url, self.headers, endpoint_name=endpoint)
-        df = pd.DataFrame(data) if data else pd.DataFrame()
+        data = make_request(url, self.headers, endpoint_name=endpoint, session=self._session)
+        df = _to_df(data, endpoint, self._dtype_backend)
         if df.empty:
-            logging.error(f"No team roster data returned for team {team_short_name} and year {year}.")
+            logging.error("No team roster data returned for team %s and year %s.", team_short_name, year)
         return df
 
     def get_team_statistics_aggregated(
@@ -252,16 +533,12 @@ class CEBLClient:
         Returns:
             pd.DataFrame: DataFrame of aggregated team statistics.
         """
-        params = {"season": season, "mode": mode}
-        if competition:
-            params["competition"] = competition
-        if segment:
-            params["segment"] = segment
+        params = _as_params(_TeamAggregatedParams(season=season, mode=mode, competition=competition, segment=segment))
 
         endpoint = "teams_statistics_aggregated"
         url = build_url(endpoint)
-        data = make_request(url, self.headers, endpoint_name=endpoint, params=params)
-        df = pd.DataFrame(data) if data else pd.DataFrame()
+        data = make_request(url, self.headers, endpoint_name=endpoint, params=params, session=self._session)
+        df = _to_df(data, endpoint, self._dtype_backend)
         if df.empty:
-            logging.error(f"No aggregated team statistics data returned for season {season}.")
+            logging.error("No aggregated team statistics data returned for season %s.", season)
         return df
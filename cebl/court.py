@@ -1,5 +1,66 @@
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
-from matplotlib.patches import Arc, Circle, Rectangle
+import numpy as np
+from matplotlib.collections import LineCollection
+
+
+def _arc_points(center, width, height, theta1, theta2, n=64):
+    """Sample an arc into an (n, 2) array of (x, y) vertices."""
+    theta = np.radians(np.linspace(theta1, theta2, n))
+    cx, cy = center
+    return np.column_stack((cx + width / 2 * np.cos(theta), cy + height / 2 * np.sin(theta)))
+
+
+def _rect_points(xy, width, height):
+    """Return the four corners of a rectangle as a closed polyline."""
+    x, y = xy
+    return np.array([(x, y), (x + width, y), (x + width, y + height), (x, y + height), (x, y)])
+
+
+# Court element polylines, sampled once at import time. Rendering them as one
+# LineCollection means matplotlib draws a single artist per court instead of
+# thirteen patches, each with its own transform and clip check — a measurable
+# win when a shot-chart figure is redrawn per frame.
+_COURT_ELEMENTS = [
+    # The basketball hoop (radius 7.5)
+    (_arc_points((250, 47.5), 15, 15, 0, 360), "solid"),
+    # Backboard
+    (_rect_points((220, 40), 60, -1), "solid"),
+    # The paint: outer box (width=16ft, height=19ft)
+    (_rect_points((170, 0), 160, 190), "solid"),
+    # The paint: inner box (width=12ft, height=19ft)
+    (_rect_points((190, 0), 120, 190), "solid"),
+    # Free throw top arc
+    (_arc_points((250, 190), 120, 120, 0, 180), "solid"),
+    # Free throw bottom arc
+    (_arc_points((250, 190), 120, 120, 180, 360), "dashed"),
+    # Restricted zone, an arc with 4ft radius from center of the hoop
+    (_arc_points((250, 47.5), 80, 80, 0, 180), "solid"),
+    # Three point line: side 3pt lines, 14ft long before they begin to arc
+    (_rect_points((30, 0), 0, 140), "solid"),
+    (_rect_points((470, 0), 0, 140), "solid"),
+    # 3pt arc - center of arc will be the hoop, arc is 23'9" away from hoop
+    (_arc_points((250, 47.5), 475, 475, 22, 158), "solid"),
+    # Center court outer and inner arcs
+    (_arc_points((250, 470), 120, 120, 180, 360), "solid"),
+    (_arc_points((250, 470), 40, 40, 180, 360), "solid"),
+]
+
+
+@lru_cache(maxsize=None)
+def _court_segments(outer_lines):
+    """
+    Return the cached (segments, linestyles) pair for a court variant.
+
+    Both variants (with and without the outer lines) are assembled at most
+    once per process; repeated draw_court calls reuse the same vertex arrays.
+    """
+    elements = list(_COURT_ELEMENTS)
+    if outer_lines:
+        # Half court line, baseline, and side outbound lines
+        elements.append((_rect_points((0, 0), 500, 470), "solid"))
+    return tuple(points for points, _ in elements), tuple(linestyle for _, linestyle in elements)
 
 
 def draw_court(ax=None, color="black", lw=2, outer_lines=False):
@@ -25,61 +86,9 @@ def draw_court(ax=None, color="black", lw=2, outer_lines=False):
     if ax is None:
         ax = plt.gca()
 
-    # Create the various parts of an NBA basketball court
-
-    # Create the basketball hoop
-    hoop = Circle((250, 47.5), radius=7.5, linewidth=lw, color=color, fill=False)
-
-    # Create backboard
-    backboard = Rectangle((220, 40), 60, -1, linewidth=lw, color=color)
-
-    # The paint
-    # Create the outer box of the paint (width=16ft, height=19ft)
-    outer_box = Rectangle((170, 0), 160, 190, linewidth=lw, color=color, fill=False)
-    # Create the inner box of the paint, width=12ft, height=19ft
-    inner_box = Rectangle((190, 0), 120, 190, linewidth=lw, color=color, fill=False)
-
-    # Create free throw top arc
-    top_free_throw = Arc((250, 190), 120, 120, theta1=0, theta2=180, linewidth=lw, color=color, fill=False)
-    # Create free throw bottom arc
-    bottom_free_throw = Arc((250, 190), 120, 120, theta1=180, theta2=0, linewidth=lw, color=color, linestyle="dashed")
-    # Restricted Zone, it is an arc with 4ft radius from center of the hoop
-    restricted = Arc((250, 47.5), 80, 80, theta1=0, theta2=180, linewidth=lw, color=color)
-
-    # Three point line
-    # Create the side 3pt lines, they are 14ft long before they begin to arc
-    corner_three_a = Rectangle((30, 0), 0, 140, linewidth=lw, color=color)
-    corner_three_b = Rectangle((470, 0), 0, 140, linewidth=lw, color=color)
-    # 3pt arc - center of arc will be the hoop, arc is 23'9" away from hoop
-    three_arc = Arc((250, 47.5), 475, 475, theta1=22, theta2=158, linewidth=lw, color=color)
-
-    # Center Court
-    center_outer_arc = Arc((250, 470), 120, 120, theta1=180, theta2=0, linewidth=lw, color=color)
-    center_inner_arc = Arc((250, 470), 40, 40, theta1=180, theta2=0, linewidth=lw, color=color)
-
-    # List of the court elements to be plotted onto the axes
-    court_elements = [
-        hoop,
-        backboard,
-        outer_box,
-        inner_box,
-        top_free_throw,
-        bottom_free_throw,
-        restricted,
-        corner_three_a,
-        corner_three_b,
-        three_arc,
-        center_outer_arc,
-        center_inner_arc,
-    ]
-
-    if outer_lines:
-        # Draw the half court line, baseline, and side outbound lines
-        outer_lines = Rectangle((0, 0), 500, 470, linewidth=lw, color=color, fill=False)
-        court_elements.append(outer_lines)
+    segments, linestyles = _court_segments(bool(outer_lines))
 
-    # Add the court elements onto the axes
-    for element in court_elements:
-        ax.add_patch(element)
+    # All court elements render as a single artist
+    ax.add_collection(LineCollection(segments, colors=color, linewidths=lw, linestyles=linestyles))
 
     return ax
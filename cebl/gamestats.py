@@ -1,12 +1,38 @@
+import asyncio
 import logging
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple
 
-import pandas as pd
-from pandas import DataFrame
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+# pandas costs ~200 ms to import and is only needed by the DataFrame-returning
+# methods, so it is imported lazily inside those; callers that stick to raw
+# JSON (get_game_data, get_shot_records) never pay for it.
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+    from .client import CEBLClient
+
+# When the optional httpx dependency is installed, season fetches run as
+# gathered coroutines over one multiplexed connection instead of a thread pool.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx when available
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
-from .client import CEBLClient
 from .constants import YearType
-from .utils import make_request
+from .utils import ijson, make_request
+
+# Upper bound on cached game-data payloads per provider instance
+_GAME_DATA_CACHE_MAX = 512
 
 
 class CEBLGameDataProvider:
@@ -24,11 +50,17 @@ class CEBLGameDataProvider:
         get_shot_data(stats_url: str) -> Tuple[DataFrame, DataFrame]:
             Extracts shot data from the game data JSON.
 
+        get_shot_records(stats_url: str) -> Tuple[list, list]:
+            Extracts raw shot records from the game data JSON.
+
         get_team_shot_data(client: CEBLClient, year: int, team_name: str) -> DataFrame:
             Retrieves shot data for a specific team over a season.
 
         get_player_shot_data(client: CEBLClient, year: int, team_name: str, player_name: str) -> DataFrame:
             Retrieves shot data for a specific player over a season.
+
+        get_season_shot_data(client: CEBLClient, year: int) -> DataFrame:
+            Retrieves shot data for every completed game in a season.
     """
 
     def __init__(self):
@@ -41,63 +73,322 @@ class CEBLGameDataProvider:
         }
         self.data_url_base = "https://fibalivestats.dcd.shared.geniussports.com/data"
 
-    def get_game_data(self, stats_url: str) -> Optional[dict]:
+        self._session = Session()
+        self._session.headers.update(self.headers)
+        self._session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+        self._game_data_cache: dict[str, dict] = {}
+        self._data_url_cache: dict[str, str] = {}
+
+    def _data_url(self, game_id: str) -> str:
+        """
+        Return the (memoized) data.json URL for a game ID.
+
+        Args:
+            game_id (str): The game ID extracted from stats_url_en.
+
+        Returns:
+            str: The full URL of the game's detailed data JSON.
+        """
+        url = self._data_url_cache.get(game_id)
+        if url is None:
+            url = f"{self.data_url_base}/{game_id}/data.json"
+            if len(self._data_url_cache) < _GAME_DATA_CACHE_MAX:
+                self._data_url_cache[game_id] = url
+        return url
+
+    def get_game_data(self, stats_url: str, use_cache: bool = True) -> Optional[dict]:
         """
         Retrieves detailed game data JSON using stats_url_en.
 
+        Completed games never change, so responses are cached per provider and
+        repeat calls for the same game skip the download and decode entirely.
+        Pass use_cache=False when fetching a game that is still in progress.
+
         Args:
             stats_url (str): The stats_url_en from CEBL API which contains the game ID.
+            use_cache (bool, optional): Whether to reuse and store cached game data. Defaults to True.
 
         Returns:
             Optional[dict]: The detailed game data JSON if successful, None otherwise.
         """
         try:
-            # Extract game ID from stats_url_en
-            game_id = stats_url.split("/")[-2]
-            # Construct data URL for detailed game data
-            data_url = f"{self.data_url_base}/{game_id}/data.json"
+            # Extract game ID from stats_url_en; rsplit avoids splitting the full path
+            game_id = stats_url.rsplit("/", 2)[-2]
+        except Exception as e:
+            logging.error("Error extracting game ID from stats URL %s: %s", stats_url, e)
+            return None
+
+        if use_cache:
+            cached = self._game_data_cache.get(game_id)
+            if cached is not None:
+                return cached
 
+        # Construct data URL for detailed game data
+        data_url = self._data_url(game_id)
+
+        try:
             # Make HTTP GET request to fetch game data
-            game_data = make_request(data_url, self.headers)
+            game_data = make_request(data_url, self.headers, session=self._session)
             if not game_data:
                 logging.error("Failed to fetch game data from URL: %s", data_url)
+            elif use_cache and len(self._game_data_cache) < _GAME_DATA_CACHE_MAX:
+                self._game_data_cache[game_id] = game_data
             return game_data
 
         except Exception as e:
             logging.error("Error fetching game data from URL %s: %s", data_url, e)
             return None
 
-    def get_shot_data(self, stats_url: str) -> Tuple[DataFrame, DataFrame]:
+    def _fetch_game_data(self, stats_urls: list) -> list:
         """
-        Extracts shot data from the game data JSON.
+        Fetch detailed game data for several games concurrently.
+
+        The fetches are purely I/O-bound, so overlapping them gives
+        near-linear speedup for a season. With the optional httpx dependency
+        installed the requests run as gathered coroutines over a single
+        client; otherwise they run in a thread pool over the shared session.
 
         Args:
+            stats_urls (list): The stats_url_en values of the games to fetch.
+
+        Returns:
+            list: Game data dicts (or None for failed fetches), in input order.
+        """
+        if not stats_urls:
+            return []
+
+        if httpx is not None:
+            # asyncio.run cannot be called from a running event loop (Jupyter
+            # notebooks, async apps), so only take the coroutine path when no
+            # loop is active; otherwise fall through to the thread pool.
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._afetch_game_data(stats_urls))
+
+        with ThreadPoolExecutor(max_workers=min(8, len(stats_urls))) as executor:
+            return list(executor.map(self.get_game_data, stats_urls))
+
+    async def _afetch_game_data(self, stats_urls: list) -> list:
+        """
+        Fetch detailed game data for several games with gathered coroutines.
+
+        Args:
+            stats_urls (list): The stats_url_en values of the games to fetch.
+
+        Returns:
+            list: Game data dicts (or None for failed fetches), in input order.
+        """
+        semaphore = asyncio.Semaphore(16)
+        async with httpx.AsyncClient(headers=self.headers, http2=_HTTP2, timeout=20) as client:
+            return list(
+                await asyncio.gather(*[self._aget_game_data(client, semaphore, url) for url in stats_urls])
+            )
+
+    async def _aget_game_data(self, client, semaphore: asyncio.Semaphore, stats_url: str) -> Optional[dict]:
+        """
+        Retrieves detailed game data JSON for one game asynchronously.
+
+        Shares the same per-provider cache as get_game_data.
+
+        Args:
+            client (httpx.AsyncClient): The client to issue the request on.
+            semaphore (asyncio.Semaphore): Limits in-flight requests to the server.
             stats_url (str): The stats_url_en from CEBL API which contains the game ID.
 
         Returns:
-            Tuple[DataFrame, DataFrame]: DataFrames of shots for home and away teams.
+            Optional[dict]: The detailed game data JSON if successful, None otherwise.
+        """
+        try:
+            game_id = stats_url.rsplit("/", 2)[-2]
+
+            cached = self._game_data_cache.get(game_id)
+            if cached is not None:
+                return cached
+
+            data_url = self._data_url(game_id)
+
+            async with semaphore:
+                response = await client.get(data_url)
+
+            if response.status_code != 200:
+                logging.error(
+                    "Request to %s failed with status code %d.", data_url, response.status_code
+                )
+                return None
+
+            game_data = response.json()
+            if not game_data:
+                logging.error("Failed to fetch game data from URL: %s", data_url)
+            elif len(self._game_data_cache) < _GAME_DATA_CACHE_MAX:
+                self._game_data_cache[game_id] = game_data
+            return game_data
+
+        except Exception as e:
+            logging.error("Error fetching game data from URL %s: %s", stats_url, e)
+            return None
+
+    def _shot_records(self, game_data: dict) -> Tuple[list, list]:
+        """
+        Extracts raw home and away shot records from already-fetched game data.
+
+        Args:
+            game_data (dict): The detailed game data JSON.
+
+        Returns:
+            Tuple[list, list]: Lists of shot dicts for home and away teams.
+        """
+        try:
+            return game_data["tm"]["1"]["shot"] or [], game_data["tm"]["2"]["shot"] or []
+
+        except KeyError as e:
+            logging.error("Error extracting shot data from game data: %s", e)
+            return [], []
+
+    def _stream_shot_records(self, data_url: str) -> Tuple[list, list]:
+        """
+        Extracts home and away shot records by streaming the game data JSON.
+
+        Parses the response incrementally with ijson and keeps only the shot
+        dicts, so the multi-megabyte play-by-play portion of data.json is
+        never decoded into Python objects.
+
+        Args:
+            data_url (str): The full URL of the game's detailed data JSON.
+
+        Returns:
+            Tuple[list, list]: Lists of shot dicts for home and away teams.
+        """
+        from ijson.common import ObjectBuilder
+
+        home_records: list = []
+        away_records: list = []
+
+        response = self._session.get(data_url, headers=self.headers, stream=True, timeout=20)
+        try:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            collecting = None
+            builder = None
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if collecting is None:
+                    if event == "start_map" and prefix in ("tm.1.shot.item", "tm.2.shot.item"):
+                        collecting = prefix
+                        builder = ObjectBuilder()
+                        builder.event(event, value)
+                else:
+                    builder.event(event, value)
+                    if event == "end_map" and prefix == collecting:
+                        records = home_records if collecting == "tm.1.shot.item" else away_records
+                        records.append(builder.value)
+                        collecting = None
+        finally:
+            response.close()
+
+        return home_records, away_records
+
+    def get_shot_records(self, stats_url: str) -> Tuple[list, list]:
+        """
+        Extracts raw shot records from the game data JSON.
+
+        Prefer this over get_shot_data when aggregating many games: the raw
+        dicts can be collected into one list and turned into a single
+        DataFrame at the end, instead of materializing a frame per game.
+        With the optional ijson dependency installed, cache misses stream the
+        shot records straight off the socket without building the full game
+        dict (and without populating the game-data cache).
+
+        Args:
+            stats_url (str): The stats_url_en from CEBL API which contains the game ID.
+
+        Returns:
+            Tuple[list, list]: Lists of shot dicts for home and away teams.
         """
+        try:
+            game_id = stats_url.rsplit("/", 2)[-2]
+        except Exception as e:
+            logging.error("Error extracting game ID from stats URL %s: %s", stats_url, e)
+            return [], []
+
+        cached = self._game_data_cache.get(game_id)
+        if cached is not None:
+            return self._shot_records(cached)
+
+        if ijson is not None:
+            try:
+                return self._stream_shot_records(self._data_url(game_id))
+            except Exception as e:
+                logging.error("Error streaming shot data for URL %s: %s", stats_url, e)
+                return [], []
+
         game_data = self.get_game_data(stats_url)
         if not game_data:
             logging.error("Couldn't find game data for URL: %s", stats_url)
-            return pd.DataFrame(), pd.DataFrame()
+            return [], []
 
-        try:
-            team1_shots = pd.DataFrame(game_data["tm"]["1"]["shot"])
-            team2_shots = pd.DataFrame(game_data["tm"]["2"]["shot"])
+        return self._shot_records(game_data)
 
-            if team1_shots.empty:
-                logging.error("Home team shots DataFrame is empty for URL: %s", stats_url)
-            if team2_shots.empty:
-                logging.error("Away team shots DataFrame is empty for URL: %s", stats_url)
+    def get_shot_data(self, stats_url: str) -> Tuple["DataFrame", "DataFrame"]:
+        """
+        Extracts shot data from the game data JSON.
 
-            return team1_shots, team2_shots
+        Args:
+            stats_url (str): The stats_url_en from CEBL API which contains the game ID.
 
-        except KeyError as e:
-            logging.error("Error extracting shot data from game data: %s", e)
-            return pd.DataFrame(), pd.DataFrame()
+        Returns:
+            Tuple[DataFrame, DataFrame]: DataFrames of shots for home and away teams.
+        """
+        import pandas as pd
+
+        # Check the raw lists before constructing anything: the common
+        # non-empty path skips both guards, and empty sides (e.g. forfeits)
+        # skip DataFrame construction from the records entirely.
+        team1_records, team2_records = self.get_shot_records(stats_url)
+        if not team1_records:
+            logging.error("Home team shots DataFrame is empty for URL: %s", stats_url)
+        if not team2_records:
+            logging.error("Away team shots DataFrame is empty for URL: %s", stats_url)
 
-    def get_team_shot_data(self, client: CEBLClient, year: YearType, team_name: str) -> DataFrame:
+        team1_shots = pd.DataFrame(team1_records) if team1_records else pd.DataFrame()
+        team2_shots = pd.DataFrame(team2_records) if team2_records else pd.DataFrame()
+
+        return team1_shots, team2_shots
+
+    @staticmethod
+    def _eligible_games(games: "DataFrame", team_name: str) -> "DataFrame":
+        """
+        Filter a season's games to completed ones involving a team.
+
+        The filter runs as one vectorized boolean mask instead of a per-row
+        Python conditional, and only the columns the season loops read survive.
+        The low-cardinality team-name columns are compared as categoricals so
+        the equality checks run on integer codes rather than strings.
+
+        Args:
+            games (DataFrame): Games for a season as returned by get_games.
+            team_name (str): The name of the team.
+
+        Returns:
+            DataFrame: The home_team_name and stats_url_en of eligible games.
+        """
+        import pandas as pd
+
+        columns = ["home_team_name", "stats_url_en"]
+        if len(games.index) == 0:
+            return pd.DataFrame(columns=columns)
+
+        slim = games[["status", "home_team_name", "away_team_name", "stats_url_en"]].copy()
+        slim["home_team_name"] = slim["home_team_name"].astype("category")
+        slim["away_team_name"] = slim["away_team_name"].astype("category")
+
+        mask = (slim["status"] == "COMPLETE") & (
+            (slim["home_team_name"] == team_name) | (slim["away_team_name"] == team_name)
+        )
+        return slim.loc[mask, columns]
+
+    def get_team_shot_data(self, client: "CEBLClient", year: YearType, team_name: str) -> "DataFrame":
         """
         Retrieves shot data for a specific team over a season.
 
@@ -109,28 +400,25 @@ class CEBLGameDataProvider:
         Returns:
             DataFrame: DataFrame of all shots for the team over the season.
         """
+        import pandas as pd
+
         try:
             games = client.get_games(year, team_name)
             team_shots = []
 
-            for _, game in games.iterrows():
-                if game["status"] == "COMPLETE" and (
-                    game["home_team_name"] == team_name or game["away_team_name"] == team_name
-                ):
-                    game_data = self.get_game_data(game["stats_url_en"])
-                    if game_data:
-                        home_shots, away_shots = self.get_shot_data(game["stats_url_en"])
-                        if game["home_team_name"] == team_name:
-                            team_shots.append(home_shots)
-                        else:
-                            team_shots.append(away_shots)
+            eligible = self._eligible_games(games, team_name)
+            game_datas = self._fetch_game_data(eligible["stats_url_en"].tolist())
+            for home_team_name, game_data in zip(eligible["home_team_name"], game_datas):
+                if game_data:
+                    home_records, away_records = self._shot_records(game_data)
+                    team_shots.extend(home_records if home_team_name == team_name else away_records)
 
             if not team_shots:
                 logging.error("No shot data found for team %s in year %d.", team_name, year)
 
-            team_shots_df = pd.concat(team_shots, ignore_index=True) if team_shots else pd.DataFrame()
+            team_shots_df = pd.DataFrame.from_records(team_shots) if team_shots else pd.DataFrame()
 
-            if team_shots_df.empty:
+            if len(team_shots_df.index) == 0:
                 logging.error(
                     "Resulting DataFrame for team %s in year %d is empty.",
                     team_name,
@@ -148,7 +436,62 @@ class CEBLGameDataProvider:
             )
             return pd.DataFrame()
 
-    def get_player_shot_data(self, client: CEBLClient, year: YearType, team_name: str, player_name: str) -> DataFrame:
+    def get_season_shot_data(self, client: "CEBLClient", year: YearType) -> "DataFrame":
+        """
+        Retrieves shot data for every completed game in a season.
+
+        Downloads each game exactly once and tags every shot record with the
+        shooting team's name and the game ID, so callers who want shots for
+        many teams or players can take one bulk fetch and filter the result
+        instead of re-downloading games per query. Fetched games land in the
+        provider's cache, so subsequent per-team or per-player calls for the
+        same season reuse them.
+
+        Args:
+            client (CEBLClient): The API client to use for fetching games.
+            year (int): The year of the season.
+
+        Returns:
+            DataFrame: All shots for the season, with team_name and game_id columns.
+        """
+        import pandas as pd
+
+        try:
+            games = client.get_games(year)
+            if len(games.index) == 0:
+                logging.error("No games found for year %d.", year)
+                return pd.DataFrame()
+
+            complete = games.loc[
+                games["status"].values == "COMPLETE",
+                ["home_team_name", "away_team_name", "stats_url_en"],
+            ]
+            stats_urls = complete["stats_url_en"].tolist()
+            game_datas = self._fetch_game_data(stats_urls)
+
+            season_shots: list = []
+            for home_name, away_name, stats_url, game_data in zip(
+                complete["home_team_name"], complete["away_team_name"], stats_urls, game_datas
+            ):
+                if not game_data:
+                    continue
+                game_id = stats_url.rsplit("/", 2)[-2]
+                home_records, away_records = self._shot_records(game_data)
+                for team_name, records in ((home_name, home_records), (away_name, away_records)):
+                    for record in records:
+                        season_shots.append({**record, "team_name": team_name, "game_id": game_id})
+
+            if not season_shots:
+                logging.error("No shot data found for year %d.", year)
+                return pd.DataFrame()
+
+            return pd.DataFrame.from_records(season_shots)
+
+        except Exception as e:
+            logging.error("Error retrieving season shot data for year %d: %s", year, e)
+            return pd.DataFrame()
+
+    def get_player_shot_data(self, client: "CEBLClient", year: YearType, team_name: str, player_name: str) -> "DataFrame":
         """
         Retrieves shot data for a specific player over a season.
 
@@ -161,21 +504,20 @@ class CEBLGameDataProvider:
         Returns:
             DataFrame: DataFrame of all shots for the player over the season.
         """
+        import pandas as pd
+
         try:
             games = client.get_games(year, team_name)
-            player_shots = []
-
-            for _, game in games.iterrows():
-                if game["status"] == "COMPLETE" and (
-                    game["home_team_name"] == team_name or game["away_team_name"] == team_name
-                ):
-                    game_data = self.get_game_data(game["stats_url_en"])
-                    if game_data:
-                        home_shots, away_shots = self.get_shot_data(game["stats_url_en"])
-                        shots = home_shots if game["home_team_name"] == team_name else away_shots
-                        player_shots.append(shots[shots["player"] == player_name])
-
-            if not player_shots:
+            team_records: list = []
+
+            eligible = self._eligible_games(games, team_name)
+            game_datas = self._fetch_game_data(eligible["stats_url_en"].tolist())
+            for home_team_name, game_data in zip(eligible["home_team_name"], game_datas):
+                if game_data:
+                    home_records, away_records = self._shot_records(game_data)
+                    team_records.extend(home_records if home_team_name == team_name else away_records)
+
+            if not team_records:
                 logging.error(
                     "No shot data found for player %s on team %s in year %d.",
                     player_name,
@@ -183,9 +525,16 @@ class CEBLGameDataProvider:
                     year,
                 )
 
-            player_shots_df = pd.concat(player_shots, ignore_index=True) if player_shots else pd.DataFrame()
+            if team_records:
+                # One vectorized filter over the whole season instead of a
+                # mask-and-slice per game
+                all_shots_df = pd.DataFrame.from_records(team_records)
+                player_shots_df = all_shots_df.loc[all_shots_df["player"].values == player_name]
+                player_shots_df = player_shots_df.reset_index(drop=True)
+            else:
+                player_shots_df = pd.DataFrame()
 
-            if player_shots_df.empty:
+            if len(player_shots_df.index) == 0:
                 logging.error(
                     "Resulting DataFrame for player %s on team %s in year %d is empty.",
                     player_name,
@@ -5,9 +5,34 @@ from typing import Optional, TypedDict
 
 import requests
 from requests import Request, Session
+from requests.adapters import HTTPAdapter, Retry
 
-# Configure logging to show info level messages
-logging.basicConfig(level=logging.INFO)
+# orjson parses large JSON payloads 2-5x faster than the stdlib; fall back to
+# the stdlib when the optional dependency is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# ijson enables incremental parsing of large record arrays straight off the
+# socket, so the full payload is never buffered and decoded twice.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for scripts that want the SDK's log output.
+
+    Libraries should not call logging.basicConfig at import time, so this is
+    opt-in: call it once from application code to see the SDK's info and
+    error messages. Applications with their own logging setup can skip it.
+
+    :param level: The logging level to configure (default is logging.INFO).
+    """
+    logging.basicConfig(level=level)
 
 
 class EndpointConfig(TypedDict):
@@ -24,6 +49,32 @@ with open(config_path, "r") as file:
 BASE_URL: str = config["base_url"]
 ENDPOINTS: dict[str, EndpointConfig] = config["endpoints"]
 
+# Structures normalized once at import so per-request validation is frozenset
+# membership tests and a single dict lookup instead of list scans and repeated
+# str conversions of the config values.
+_ENDPOINT_PATHS: dict[str, str] = {
+    name: endpoint["path"] for name, endpoint in ENDPOINTS.items() if isinstance(endpoint, dict) and "path" in endpoint
+}
+_VALID_PARAM_SETS: dict[str, dict[str, frozenset[str]]] = {
+    name: {
+        key: frozenset(map(str, values)) if isinstance(values, list) else frozenset()
+        for key, values in endpoint.get("params", {}).items()
+    }
+    for name, endpoint in ENDPOINTS.items()
+}
+_IGNORED_PARAM_KEYS = frozenset({"team_id", "player_id"})
+
+# Default pooled session used when a caller doesn't supply one: amortizes the
+# TCP+TLS handshake across requests and retries transient server errors.
+_SESSION = Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
 
 def build_url(
     endpoint_name: str,
@@ -37,16 +88,41 @@ def build_url(
     :return: The full URL as a string.
     :raises ValueError: If the endpoint name is not found.
     """
-    endpoint = ENDPOINTS.get(endpoint_name)
-    if not endpoint or not isinstance(endpoint, dict) or "path" not in endpoint:
+    path = _ENDPOINT_PATHS.get(endpoint_name)
+    if path is None:
         raise ValueError(f"Endpoint {endpoint_name} not found in configuration.")
 
     # Validate parameters
-    if not validate_params(endpoint, kwargs):
+    if not validate_params(endpoint_name, kwargs):
+        raise ValueError(f"Invalid parameters for endpoint: {endpoint_name}. Check logs for details.")
+
+    return f"{BASE_URL}{path.format(**kwargs)}"
+
+
+def prepare_request(
+    endpoint_name: str,
+    params: Optional[dict[str, str]] = None,
+    **kwargs: str,
+) -> tuple[str, dict[str, str]]:
+    """
+    Validate and build the URL and query parameters for an endpoint.
+
+    Shared by the synchronous and asynchronous request paths so validation
+    happens exactly once per call.
+
+    :param endpoint_name: The name of the endpoint to use.
+    :param params: Optional query parameters to include in the request.
+    :param kwargs: Additional parameters to format the endpoint path.
+    :return: A tuple of (url, params) ready for an HTTP GET request.
+    :raises ValueError: If the endpoint name or parameters are invalid.
+    """
+    url = build_url(endpoint_name, **kwargs)
+    params = params or {}
+
+    if not validate_params(endpoint_name, params):
         raise ValueError(f"Invalid parameters for endpoint: {endpoint_name}. Check logs for details.")
 
-    path = endpoint["path"].format(**kwargs)
-    return f"{BASE_URL}{path}"
+    return url, params
 
 
 def make_request(
@@ -55,6 +131,7 @@ def make_request(
     endpoint_name: Optional[str] = None,
     params: Optional[dict[str, str]] = None,
     timeout: int = 20,
+    session: Optional[Session] = None,
 ) -> Optional[dict]:
     """
     Make an HTTP GET request and return the JSON response.
@@ -64,33 +141,97 @@ def make_request(
     :param endpoint_name: The name of the endpoint to use for validation.
     :param params: Optional query parameters to include in the request.
     :param timeout: Timeout for the request in seconds (default is 20 seconds).
+    :param session: Optional requests.Session to reuse for connection pooling.
     :return: The JSON response if successful, otherwise None.
     """
     if endpoint_name:
-        endpoint = ENDPOINTS.get(endpoint_name)
-        if not endpoint:
+        if endpoint_name not in ENDPOINTS:
             raise ValueError(f"Endpoint '{endpoint_name}' not found in configuration.")
 
         # Validate parameters
-        if not validate_params(endpoint, params or {}):
+        if not validate_params(endpoint_name, params or {}):
             raise ValueError(f"Invalid parameters for endpoint: {endpoint_name}. Check logs for details.")
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=timeout)
+        requester = session if session is not None else _SESSION
+        response = requester.get(url, headers=headers, params=params, timeout=timeout)
 
         if response.status_code == 200:
-            return response.json()
+            return _json_loads(response.content)
         elif response.status_code == 401:
             logging.error("Unauthorized access. The API key may be invalid or expired.")
             raise PermissionError("Unauthorized access. The API key may be invalid or expired.")
         else:
-            logging.error(f"Request to {url} failed with status code {response.status_code}. Response: {response.text}")
+            logging.error(
+                "Request to %s failed with status code %d. Response: %s", url, response.status_code, response.text
+            )
             response.raise_for_status()  # Raises HTTPError for bad responses
     except requests.RequestException as e:
-        logging.error(f"Request failed: {e}")
+        logging.error("Request failed: %s", e)
         raise  # Re-raise the exception to notify the caller
 
 
+def iter_records(
+    url: str,
+    headers: dict[str, str],
+    endpoint_name: Optional[str] = None,
+    params: Optional[dict[str, str]] = None,
+    timeout: int = 20,
+    session: Optional[Session] = None,
+):
+    """
+    Yield records from a JSON-array endpoint one at a time.
+
+    When the optional ijson dependency is installed, the response is streamed
+    and parsed incrementally, keeping peak memory at roughly one copy of the
+    records instead of payload bytes plus the fully parsed list. Without
+    ijson this falls back to make_request and yields from the parsed list.
+
+    :param url: The URL to send the request to.
+    :param headers: Headers to include in the request.
+    :param endpoint_name: The name of the endpoint to use for validation.
+    :param params: Optional query parameters to include in the request.
+    :param timeout: Timeout for the request in seconds (default is 20 seconds).
+    :param session: Optional requests.Session to reuse for connection pooling.
+    :return: An iterator over the individual records of the response array.
+    """
+    if ijson is None:
+        yield from (
+            make_request(url, headers, endpoint_name=endpoint_name, params=params, timeout=timeout, session=session)
+            or []
+        )
+        return
+
+    if endpoint_name:
+        if endpoint_name not in ENDPOINTS:
+            raise ValueError(f"Endpoint '{endpoint_name}' not found in configuration.")
+
+        if not validate_params(endpoint_name, params or {}):
+            raise ValueError(f"Invalid parameters for endpoint: {endpoint_name}. Check logs for details.")
+
+    try:
+        requester = session if session is not None else _SESSION
+        response = requester.get(url, headers=headers, params=params, timeout=timeout, stream=True)
+
+        try:
+            if response.status_code == 200:
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, "item", use_float=True)
+            elif response.status_code == 401:
+                logging.error("Unauthorized access. The API key may be invalid or expired.")
+                raise PermissionError("Unauthorized access. The API key may be invalid or expired.")
+            else:
+                logging.error(
+                    "Request to %s failed with status code %d. Response: %s", url, response.status_code, response.text
+                )
+                response.raise_for_status()
+        finally:
+            response.close()
+    except requests.RequestException as e:
+        logging.error("Request failed: %s", e)
+        raise
+
+
 def print_request_headers(url: str, headers: dict[str, str]) -> None:
     """
     Print the headers of a prepared HTTP GET request.
@@ -105,38 +246,39 @@ def print_request_headers(url: str, headers: dict[str, str]) -> None:
 
     logging.info("Request Headers:")
     for key, value in prepared_req.headers.items():
-        logging.info(f"{key}: {value}")
+        logging.info("%s: %s", key, value)
 
 
-def validate_params(endpoint_config: EndpointConfig, params: dict[str, list[str]]) -> bool:
+def validate_params(endpoint_name: str, params: dict[str, list[str]]) -> bool:
     """
     Validates the parameters against the endpoint configuration, skipping specific keys.
 
     Args:
-        endpoint_config (dict): The configuration of the endpoint.
+        endpoint_name (str): The name of the endpoint to validate against.
         params (dict): The parameters to validate.
 
     Returns:
         bool: True if all parameters are valid, False otherwise.
     """
-    valid_params: dict = endpoint_config.get("params", {})
-    ignore_keys = {"team_id", "player_id"}
+    valid_params = _VALID_PARAM_SETS.get(endpoint_name, {})
 
     all_valid = True
 
     for key, value in params.items():
-        if key in ignore_keys:
+        if key in _IGNORED_PARAM_KEYS:
             continue
 
         if key not in valid_params:
-            logging.error(f"Parameter '{key}' is not valid for this endpoint.")
+            logging.error("Parameter '%s' is not valid for this endpoint.", key)
             all_valid = False
             continue
 
-        # Check if the value is in the list of valid values for this key
-        valid_values = valid_params.get(key, {})
+        # Check if the value is in the set of valid values for this key
+        valid_values = valid_params[key]
         if valid_values and str(value) not in valid_values:
-            logging.error(f"Value '{value}' for parameter '{key}' is not valid. Valid values are: {valid_values}.")
+            logging.error(
+                "Value '%s' for parameter '%s' is not valid. Valid values are: %s.", value, key, sorted(valid_values)
+            )
             all_valid = False
 
     return all_valid
@@ -0,0 +1,55 @@
+import asyncio
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("httpx")
+
+from cebl.async_client import AsyncCEBLClient
+
+
+def run_with_client(coro_fn):
+    """Run a coroutine taking an AsyncCEBLClient, managing the client lifecycle."""
+
+    async def runner():
+        api_key = os.getenv("CEBL_API_KEY")
+        async with AsyncCEBLClient(CEBL_API_KEY=api_key) as client:
+            return await coro_fn(client)
+
+    return asyncio.run(runner())
+
+
+def test_aget_games():
+    result = run_with_client(lambda client: client.aget_games(2024))
+    assert isinstance(result, pd.DataFrame)
+    assert not result.empty
+    assert "home_team_id" in result.columns
+    assert "away_team_score" in result.columns
+
+
+def test_aget_games_filtered_by_team():
+    async def fetch(client):
+        filtered = await client.aget_games(2024, team_name="Calgary")
+        return filtered, client._teams_cache
+
+    result, teams_cache = run_with_client(fetch)
+    assert isinstance(result, pd.DataFrame)
+    assert not result.empty
+    assert 2024 in teams_cache
+    assert "calgary" in teams_cache[2024]
+
+
+def test_aget_teams():
+    result = run_with_client(lambda client: client.aget_teams(2024))
+    assert isinstance(result, pd.DataFrame)
+    assert not result.empty
+    assert "id" in result.columns
+    assert "short_name_en" in result.columns
+
+
+def test_get_many_games():
+    result = run_with_client(lambda client: client.get_many_games([2023, 2024]))
+    assert isinstance(result, pd.DataFrame)
+    assert not result.empty
+    assert "home_team_id" in result.columns
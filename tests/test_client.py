@@ -34,6 +34,27 @@ def test_get_games(api_client):
     assert "venue_name" in result.columns
 
 
+def test_get_games_multi(api_client):
+    result = api_client.get_games_multi([2023, 2024])
+    assert isinstance(result, pd.DataFrame)
+    assert not result.empty
+    assert "home_team_id" in result.columns
+    assert "away_team_score" in result.columns
+
+
+def test_parallel(api_client):
+    games, teams = api_client.parallel(
+        [
+            lambda: api_client.get_games(2024),
+            lambda: api_client.get_teams(2024),
+        ]
+    )
+    assert isinstance(games, pd.DataFrame)
+    assert isinstance(teams, pd.DataFrame)
+    assert not games.empty
+    assert not teams.empty
+
+
 def test_get_teams(api_client):
     year = 2024
     result = api_client.get_teams(year)
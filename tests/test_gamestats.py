@@ -1,17 +1,30 @@
+import io
+import json
+import os
+
+import pandas as pd
 import pytest
 
+from cebl.client import CEBLClient
 from cebl.gamestats import CEBLGameDataProvider
 
+STATS_URL = "https://fibalivestats.dcd.shared.geniussports.com/u/CEBL/2400360/"
+
 
 @pytest.fixture
 def client():
     return CEBLGameDataProvider()
 
 
+@pytest.fixture
+def api_client():
+    api_key = os.getenv("CEBL_API_KEY")
+    return CEBLClient(CEBL_API_KEY=api_key)
+
+
 @pytest.fixture
 def result(client: CEBLGameDataProvider):
-    stats_url = "https://fibalivestats.dcd.shared.geniussports.com/u/CEBL/2400360/"
-    return client.get_game_data(stats_url)
+    return client.get_game_data(STATS_URL)
 
 
 def test_basic_fields(result):
@@ -41,3 +54,81 @@ def test_team_details(result):
     assert team1["coach"] == "T. Vernon"
     assert team2["code"] == "EDM"
     assert team2["coach"] == "J. Baker"
+
+
+def test_get_shot_records(client: CEBLGameDataProvider):
+    home_records, away_records = client.get_shot_records(STATS_URL)
+
+    assert isinstance(home_records, list)
+    assert isinstance(away_records, list)
+    assert home_records and away_records
+    for record in (home_records[0], away_records[0]):
+        assert "player" in record
+        assert "x" in record
+        assert "y" in record
+
+
+def test_get_season_shot_data(client: CEBLGameDataProvider, api_client: CEBLClient, monkeypatch):
+    # Slice the season to a few completed games so the test downloads a
+    # handful of data.json payloads instead of ~100
+    games = api_client.get_games(2024)
+    sample = games.loc[games["status"] == "COMPLETE"].head(3)
+    monkeypatch.setattr(api_client, "get_games", lambda year: sample)
+
+    result = client.get_season_shot_data(api_client, 2024)
+
+    assert isinstance(result, pd.DataFrame)
+    assert not result.empty
+    assert "player" in result.columns
+    assert "team_name" in result.columns
+    assert "game_id" in result.columns
+    # Both sides of every game shoot, and each game is fetched exactly once
+    assert result["team_name"].nunique() >= 2
+    assert result["game_id"].nunique() == len(sample)
+
+
+def test_stream_shot_records(client: CEBLGameDataProvider, monkeypatch):
+    pytest.importorskip("ijson")
+
+    payload = {
+        "clock": "00:00",
+        "pbp": [{"gt": "10:00", "actionNumber": n} for n in range(50)],
+        "tm": {
+            "1": {"name": "Home", "shot": [{"player": "A. One", "x": 10.5, "y": 20.0, "r": 1}]},
+            "2": {"name": "Away", "shot": [{"player": "B. Two", "x": 30.0, "y": 40.5, "r": 0}]},
+        },
+    }
+
+    class FakeResponse:
+        raw = io.BytesIO(json.dumps(payload).encode())
+
+        def raise_for_status(self):
+            pass
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(client._session, "get", lambda *args, **kwargs: FakeResponse())
+    home_records, away_records = client._stream_shot_records("https://example.com/data.json")
+
+    assert home_records == payload["tm"]["1"]["shot"]
+    assert away_records == payload["tm"]["2"]["shot"]
+
+
+def test_eligible_games(client: CEBLGameDataProvider):
+    games = pd.DataFrame(
+        {
+            "status": ["COMPLETE", "SCHEDULED", "COMPLETE"],
+            "home_team_name": ["Calgary Surge", "Calgary Surge", "Edmonton Stingers"],
+            "away_team_name": ["Edmonton Stingers", "Vancouver Bandits", "Calgary Surge"],
+            "stats_url_en": ["url1", "url2", "url3"],
+        }
+    )
+
+    eligible = client._eligible_games(games, "Calgary Surge")
+
+    assert list(eligible.columns) == ["home_team_name", "stats_url_en"]
+    assert list(eligible["stats_url_en"]) == ["url1", "url3"]
+
+    empty = client._eligible_games(pd.DataFrame(), "Calgary Surge")
+    assert empty.empty